@@ -22,23 +22,24 @@ HEADER = """
 """.lstrip()
 
 inputfilename = sys.argv[1]
-inputfile = open(inputfilename)
 idlList = []
 recording = False
-idlStart = re.compile("\<script .*type=[\'\"]?idl")
-idlStop = re.compile("\</script\>")
+idlStart = re.compile(r"<script .*type=['\"]?idl")
+idlStop = re.compile(r"</script>")
 
 idlLineList = []
-for line in inputfile:
-    line = line.rstrip()
-    if idlStart.search(line) != None:
-        recording = True
-    elif idlStop.search(line) != None:
-        recording = False
-        idlList.append("\n".join(idlLineList))
-        idlLineList = []
-    elif recording:
-        idlLineList.append(line)
+with open(inputfilename) as inputfile:
+    for line in inputfile:
+        # Both patterns contain "script"; only run them on lines that do.
+        mayBeScriptTag = "script" in line
+        if mayBeScriptTag and idlStart.search(line) != None:
+            recording = True
+        elif mayBeScriptTag and idlStop.search(line) != None:
+            recording = False
+            idlList.append("\n".join(idlLineList))
+            idlLineList = []
+        elif recording:
+            idlLineList.append(line.rstrip())
 
 headerTemplate = Template(HEADER)
 print(headerTemplate.substitute(YEAR=date.today().year) + "\n\n\n".join(idlList))